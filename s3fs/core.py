@@ -5,6 +5,7 @@ import logging
 import math
 import mimetypes
 import os
+import random
 import socket
 import weakref
 import re
@@ -68,6 +69,11 @@ S3_RETRYABLE_ERRORS = (
     ResponseParserError,
 )
 
+# Exponential backoff between retries, capped at 15s; the sleep actually used
+# is drawn from [base/2, base] ("equal jitter"), so that many clients throttled
+# at the same moment do not all retry in lockstep.
+_BACKOFF_TABLE = tuple(min(1.7**i * 0.1, 15.0) for i in range(64))
+
 MAX_UPLOAD_PARTS = 10_000  # maximum number of parts for S3 multipart upload
 
 if ClientPayloadError is not None:
@@ -107,32 +113,128 @@ key_acls = {
 buck_acls = {"private", "public-read", "public-read-write", "authenticated-read"}
 
 
+def add_retryable_error(*excs):
+    """
+    Add exception types to the set of errors which are retried by s3fs.
+
+    Several types may be given at once, in which case the registry is rebuilt
+    only once. Types which are already registered are ignored.
+
+    Parameters
+    ----------
+    excs : type
+        The exception classes (or subclasses thereof) to treat as retryable.
+    """
+    global S3_RETRYABLE_ERRORS
+    # dict preserves order while dropping duplicates
+    S3_RETRYABLE_ERRORS = tuple(dict.fromkeys(S3_RETRYABLE_ERRORS + excs))
+
+
+def _default_error_handler(e):
+    return False
+
+
+CUSTOM_ERROR_HANDLER = _default_error_handler
+
+
+def set_custom_error_handler(func):
+    """
+    Set a function to decide whether otherwise non-retryable errors are retried.
+
+    Parameters
+    ----------
+    func : callable or None
+        Called with the exception instance; if it returns True, the call is
+        retried with the usual backoff. None restores the default, which
+        never retries.
+    """
+    global CUSTOM_ERROR_HANDLER
+    CUSTOM_ERROR_HANDLER = func if func is not None else _default_error_handler
+
+
+def _client_error_code(e):
+    """The ``Error.Code`` of a botocore ClientError, or None if not available"""
+    try:
+        return e.response["Error"]["Code"]
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+# Private generator for retry jitter: unaffected by user code calling
+# ``random.seed()``, and reseeded in forked children so that worker processes
+# do not all draw the same delays.
+_JITTER_RNG = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_JITTER_RNG.seed)
+
+
+# ClientError codes for transient conditions that are always retried
+_CLIENT_ERROR_RETRY = frozenset(
+    {
+        "SlowDown",
+        "XAmzContentSHA256Mismatch",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "PriorRequestNotComplete",
+        "InternalError",
+        "ServiceUnavailable",
+    }
+)
+# ... and text which marks a ClientError as retryable when its code is missing or
+# unexpected, e.g., throttling responses from S3-compatible services
+_CLIENT_ERROR_RETRY_MESSAGES = (
+    "SlowDown",
+    "reduce your request rate",
+    "XAmzContentSHA256Mismatch",
+)
+
+
+def _has_retryable_message(e):
+    msg = str(e)
+    return any(m in msg for m in _CLIENT_ERROR_RETRY_MESSAGES)
+
+
+def _backoff_delay(attempt):
+    base = _BACKOFF_TABLE[min(attempt, len(_BACKOFF_TABLE) - 1)]
+    return base * 0.5 + base * 0.5 * _JITTER_RNG.random()
+
+
 async def _error_wrapper(func, *, args=(), kwargs=None, retries):
     if kwargs is None:
         kwargs = {}
+    # read the (immutable) module-level settings once per call, rather than
+    # on every failed attempt
+    retryable = S3_RETRYABLE_ERRORS
+    handler = CUSTOM_ERROR_HANDLER
     for i in range(retries):
         try:
             return await func(*args, **kwargs)
-        except S3_RETRYABLE_ERRORS as e:
-            err = e
-            logger.debug("Retryable error: %s", e)
-            await asyncio.sleep(min(1.7**i * 0.1, 15))
-        except ClientError as e:
-            logger.debug("Client error (maybe retryable): %s", e)
+        except Exception as e:
             err = e
-            wait_time = min(1.7**i * 0.1, 15)
-            if "SlowDown" in str(e):
-                await asyncio.sleep(wait_time)
-            elif "reduce your request rate" in str(e):
-                await asyncio.sleep(wait_time)
-            elif "XAmzContentSHA256Mismatch" in str(e):
-                await asyncio.sleep(wait_time)
+            if i + 1 >= retries:
+                # no attempts left (always the case for retries=1): skip the
+                # classification and the backoff sleep, and just raise
+                logger.debug("Error on final attempt: %s", e)
+                break
+            if isinstance(e, retryable):
+                logger.debug("Retryable error: %s", e)
+                await asyncio.sleep(_backoff_delay(i))
+            elif isinstance(e, ClientError):
+                logger.debug("Client error (maybe retryable): %s", e)
+                if (
+                    _client_error_code(e) in _CLIENT_ERROR_RETRY
+                    or _has_retryable_message(e)
+                    or handler(e)
+                ):
+                    await asyncio.sleep(_backoff_delay(i))
+                else:
+                    break
+            elif handler(e):
+                logger.debug("Retryable error (custom handler): %s", e)
+                await asyncio.sleep(_backoff_delay(i))
             else:
+                logger.debug("Nonretryable error: %s", e)
                 break
-        except Exception as e:
-            logger.debug("Nonretryable error: %s", e)
-            err = e
-            break
 
     if "'coroutine'" in str(err):
         # aiobotocore internal error - fetch original botocore error
@@ -1417,7 +1519,7 @@ class S3FileSystem(AsyncFileSystem):
                         except Exception:
                             pass
 
-                        await asyncio.sleep(min(1.7**failed_reads * 0.1, 15))
+                        await asyncio.sleep(_backoff_delay(failed_reads))
                         # Byte ranges are inclusive, which means we need to be careful to not read the same data twice
                         # in a failure.
                         # Examples:
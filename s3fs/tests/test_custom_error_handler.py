@@ -0,0 +1,340 @@
+import asyncio
+import random
+
+import pytest
+from botocore.exceptions import ClientError
+
+import s3fs.core
+from s3fs.core import (
+    _client_error_code,
+    _error_wrapper,
+    add_retryable_error,
+    set_custom_error_handler,
+)
+
+# all tests in this module share a single event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class CustomRetryableError(Exception):
+    __slots__ = ()
+
+
+class CustomNonRetryableError(Exception):
+    __slots__ = ()
+
+
+def _retry_if_custom(e):
+    return isinstance(e, CustomRetryableError)
+
+
+@pytest.fixture(autouse=True)
+def reset_error_handler(monkeypatch):
+    # monkeypatch restores the original values on teardown, even if a test fails
+    monkeypatch.setattr(
+        s3fs.core, "CUSTOM_ERROR_HANDLER", s3fs.core._default_error_handler
+    )
+    monkeypatch.setattr(s3fs.core, "S3_RETRYABLE_ERRORS", s3fs.core.S3_RETRYABLE_ERRORS)
+
+
+async def test_handler_retry_on_custom_exception():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise CustomRetryableError("try again")
+        return "success"
+
+    set_custom_error_handler(_retry_if_custom)
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_handler_no_retry_on_other_exception():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        raise CustomNonRetryableError("give up")
+
+    set_custom_error_handler(_retry_if_custom)
+
+    with pytest.raises(CustomNonRetryableError):
+        await _error_wrapper(failing_func, retries=5)
+    assert len(calls) == 1
+
+
+async def test_handler_max_retries():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        raise CustomRetryableError("always fails")
+
+    set_custom_error_handler(_retry_if_custom)
+
+    with pytest.raises(CustomRetryableError):
+        await _error_wrapper(failing_func, retries=3)
+    assert len(calls) == 3
+
+
+async def test_handler_sleep_behavior():
+    times = []
+    loop = asyncio.get_running_loop()
+
+    async def failing_func():
+        times.append(loop.time())
+        if len(times) < 3:
+            raise CustomRetryableError("try again")
+        return "success"
+
+    set_custom_error_handler(_retry_if_custom)
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    # backoff base is min(1.7**i * 0.1, 15): 0.1s, then 0.17s, with the
+    # actual sleep jittered into [base/2, base]
+    assert times[1] - times[0] >= 0.045
+    assert times[2] - times[1] >= 0.08
+
+
+async def test_set_custom_error_handler_none():
+    set_custom_error_handler(_retry_if_custom)
+    set_custom_error_handler(None)
+    assert s3fs.core.CUSTOM_ERROR_HANDLER is s3fs.core._default_error_handler
+
+
+async def test_falsy_handler_is_kept():
+    class Handler:
+        def __len__(self):
+            return 0
+
+        def __call__(self, e):
+            return isinstance(e, CustomRetryableError)
+
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise CustomRetryableError("try again")
+        return "success"
+
+    set_custom_error_handler(Handler())
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_default_handler_does_not_retry():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        raise CustomRetryableError("not registered")
+
+    with pytest.raises(CustomRetryableError):
+        await _error_wrapper(failing_func, retries=5)
+    assert len(calls) == 1
+
+
+async def test_handler_with_client_error():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ClientError(
+                {"Error": {"Code": "ThrottledByProxy", "Message": "busy"}},
+                "get_object",
+            )
+        return "success"
+
+    def custom_handler(e):
+        return (
+            isinstance(e, ClientError) and _client_error_code(e) == "ThrottledByProxy"
+        )
+
+    set_custom_error_handler(custom_handler)
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_handler_preserves_builtin_retry_pattern():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ClientError(
+                {"Error": {"Code": "SlowDown", "Message": "Please reduce"}},
+                "put_object",
+            )
+        return "success"
+
+    # a handler which never retries must not stop the built-in retries
+    set_custom_error_handler(lambda e: False)
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_add_retryable_error():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise CustomRetryableError("try again")
+        return "success"
+
+    add_retryable_error(CustomRetryableError)
+    assert CustomRetryableError in s3fs.core.S3_RETRYABLE_ERRORS
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_add_retryable_error_subclass():
+    class SubclassRetryableError(CustomRetryableError):
+        pass
+
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) == 1:
+            raise CustomRetryableError("exact type")
+        if len(calls) == 2:
+            raise SubclassRetryableError("subclass")
+        return "success"
+
+    add_retryable_error(CustomRetryableError)
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_add_retryable_error_dedup():
+    before = s3fs.core.S3_RETRYABLE_ERRORS
+    add_retryable_error(CustomRetryableError, CustomNonRetryableError)
+    add_retryable_error(CustomRetryableError)
+    assert s3fs.core.S3_RETRYABLE_ERRORS == before + (
+        CustomRetryableError,
+        CustomNonRetryableError,
+    )
+
+
+async def test_add_retryable_error_after_failure():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise CustomRetryableError("try again")
+        return "success"
+
+    # an unregistered type is not retried...
+    with pytest.raises(CustomRetryableError):
+        await _error_wrapper(failing_func, retries=5)
+    assert len(calls) == 1
+
+    # ...and registering it afterwards must take effect straight away
+    add_retryable_error(CustomRetryableError)
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_client_error_code():
+    e = ClientError({"Error": {"Code": "SlowDown"}}, "get_object")
+    assert _client_error_code(e) == "SlowDown"
+    assert _client_error_code(ClientError({}, "get_object")) is None
+    assert _client_error_code(CustomRetryableError()) is None
+
+
+async def test_no_sleep_after_last_attempt(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(t):
+        sleeps.append(t)
+
+    monkeypatch.setattr(s3fs.core.asyncio, "sleep", fake_sleep)
+
+    async def failing_func():
+        raise CustomRetryableError("always fails")
+
+    set_custom_error_handler(_retry_if_custom)
+
+    with pytest.raises(CustomRetryableError):
+        await _error_wrapper(failing_func, retries=1)
+    assert sleeps == []
+
+    with pytest.raises(CustomRetryableError):
+        await _error_wrapper(failing_func, retries=3)
+    assert len(sleeps) == 2
+
+
+async def test_final_attempt_is_logged(caplog):
+    async def failing_func():
+        raise ValueError("bad value")
+
+    with caplog.at_level("DEBUG", logger="s3fs"):
+        with pytest.raises(ValueError):
+            await _error_wrapper(failing_func, retries=1)
+    assert "Error on final attempt: bad value" in caplog.messages
+
+
+async def test_backoff_jitter_independent_of_global_seed():
+    # seeding the global generator, as user code may do, must not make the
+    # jitter repeat
+    state = random.getstate()
+    try:
+        random.seed(0)
+        first = [s3fs.core._backoff_delay(i) for i in range(10)]
+        random.seed(0)
+        second = [s3fs.core._backoff_delay(i) for i in range(10)]
+    finally:
+        random.setstate(state)
+    assert first != second
+    for i, d in enumerate(first):
+        base = s3fs.core._BACKOFF_TABLE[i]
+        assert base / 2 <= d <= base
+    # beyond the end of the table, the last (capped) entry is used
+    cap = s3fs.core._BACKOFF_TABLE[-1]
+    assert cap / 2 <= s3fs.core._backoff_delay(1000) <= cap
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "InternalError",
+        "ServiceUnavailable",
+        "RequestTimeout",
+        "PriorRequestNotComplete",
+    ],
+)
+async def test_retry_on_transient_client_error_code(code):
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ClientError({"Error": {"Code": code}}, "get_object")
+        return "success"
+
+    assert await _error_wrapper(failing_func, retries=5) == "success"
+    assert len(calls) == 3
+
+
+async def test_no_retry_on_other_client_error_code():
+    calls = []
+
+    async def failing_func():
+        calls.append(1)
+        raise ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "gone"}}, "get_object"
+        )
+
+    with pytest.raises(FileNotFoundError):
+        await _error_wrapper(failing_func, retries=5)
+    assert len(calls) == 1
@@ -1106,6 +1106,28 @@ def test_errors_cause_preservings(monkeypatch, s3):
     assert exc.value.__cause__ is None
 
 
+def test_retries_set_after_init(monkeypatch, s3):
+    # the retry count is read on each call, so changing it on a live
+    # instance takes effect
+    calls = []
+
+    async def head_object(*args, **kwargs):
+        calls.append(1)
+        raise botocore.exceptions.HTTPClientError(error="flaky")
+
+    async def no_sleep(t):
+        pass
+
+    s3.ls(test_bucket_name)  # establish the session before patching the client
+    monkeypatch.setattr(type(s3.s3), "head_object", head_object)
+    monkeypatch.setattr(s3fs.core.asyncio, "sleep", no_sleep)
+
+    monkeypatch.setattr(s3, "retries", 2)
+    with pytest.raises(botocore.exceptions.HTTPClientError):
+        s3.call_s3("head_object", Bucket=test_bucket_name, Key="test/a.txt")
+    assert len(calls) == 2
+
+
 def test_read_small(s3):
     fn = test_bucket_name + "/2014-01-01.csv"
     with s3.open(fn, "rb", block_size=10, cache_type="bytes") as f:
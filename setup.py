@@ -3,6 +3,11 @@
 from setuptools import setup
 import versioneer
 
+with open("requirements.txt") as f:
+    install_requires = [
+        line.strip() for line in f if line.strip() and not line.startswith("#")
+    ]
+
 setup(
     name="s3fs",
     version=versioneer.get_version(),
@@ -26,7 +31,7 @@ setup(
     keywords="s3, boto",
     packages=["s3fs"],
     python_requires=">= 3.10",
-    install_requires=[open("requirements.txt").read().strip().split("\n")],
+    install_requires=install_requires,
     long_description="README.md",
     long_description_content_type="text/markdown",
     zip_safe=False,